@@ -1,5 +1,8 @@
 """Config flow for Miner."""
+import asyncio
+import functools
 import logging
+import time
 
 import pyasic
 import voluptuous as vol
@@ -19,24 +22,95 @@ from .const import CONF_SSH_USERNAME
 from .const import CONF_TITLE
 from .const import CONF_WEB_PASSWORD
 from .const import CONF_WEB_USERNAME
+from .const import DISCOVERY_CACHE_TTL
+from .const import DISCOVERY_MIN_NETWORK_PREFIX
+from .const import DISCOVERY_SCAN_CONCURRENCY
 from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
+# (monotonic time, scanned subnets, skipped IPs, result) of the last discovery scan
+_LAST_DISCOVERY: tuple[float, tuple[str, ...], frozenset[str], bool] | None = None
+
+
+@functools.lru_cache(maxsize=16)
+def _miner_network(subnet: str) -> MinerNetwork:
+    """Return the MinerNetwork for a subnet, reused across discovery scans."""
+    return MinerNetwork.from_subnet(subnet)
+
+
+async def _async_subnet_has_miner(
+    subnet: str, known_ips: frozenset[str], semaphore: asyncio.Semaphore
+) -> bool:
+    """Return if any host on the subnet, other than known IPs, answers as a miner."""
+    miner_net = _miner_network(subnet)
+
+    async def _probe(host):
+        async with semaphore:
+            return await miner_net.ping_and_get_miner(host)
+
+    tasks = [
+        asyncio.create_task(_probe(host))
+        for host in miner_net.hosts
+        if str(host) not in known_ips
+    ]
+
+    try:
+        for probe in asyncio.as_completed(tasks):
+            if await probe is not None:
+                return True
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    return False
+
 
 async def _async_has_devices(hass: HomeAssistant) -> bool:
     """Return if there are devices that can be discovered."""
+    global _LAST_DISCOVERY
+
     adapters = await network.async_get_adapters(hass)
 
-    for adapter in adapters:
-        for ip_info in adapter["ipv4"]:
-            local_ip = ip_info["address"]
-            network_prefix = ip_info["network_prefix"]
-            miner_net = MinerNetwork.from_subnet(f"{local_ip}/{network_prefix}")
-            miners = await miner_net.scan()
-            if len(miners) > 0:
-                return True
-    return False
+    subnets = tuple(
+        f"{ip_info['address']}/{ip_info['network_prefix']}"
+        for adapter in adapters
+        for ip_info in adapter["ipv4"]
+        if ip_info["network_prefix"] >= DISCOVERY_MIN_NETWORK_PREFIX
+    )
+
+    known_ips = frozenset(
+        entry.data.get(CONF_IP) for entry in hass.config_entries.async_entries(DOMAIN)
+    )
+
+    if _LAST_DISCOVERY is not None:
+        scanned_at, scanned_subnets, skipped_ips, found = _LAST_DISCOVERY
+        if (
+            scanned_subnets == subnets
+            and skipped_ips == known_ips
+            and time.monotonic() - scanned_at < DISCOVERY_CACHE_TTL
+        ):
+            return found
+
+    found = False
+    semaphore = asyncio.Semaphore(DISCOVERY_SCAN_CONCURRENCY)
+    tasks = [
+        asyncio.create_task(_async_subnet_has_miner(subnet, known_ips, semaphore))
+        for subnet in subnets
+    ]
+
+    try:
+        for scan in asyncio.as_completed(tasks):
+            if await scan:
+                found = True
+                break
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    _LAST_DISCOVERY = (time.monotonic(), subnets, known_ips, found)
+    return found
 
 
 register_discovery_flow(DOMAIN, "miner", _async_has_devices)
@@ -64,6 +138,7 @@ class MinerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Initialize."""
         self._data = {}
         self._miner = None
+        self._title = None
 
     async def async_step_user(self, user_input=None):
         """Get miner IP and check if it is available."""
@@ -102,8 +177,8 @@ class MinerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                         CONF_RPC_PASSWORD,
                         default=user_input.get(
                             CONF_RPC_PASSWORD,
-                            self._miner.web.pwd
-                            if self._miner.api.pwd is not None
+                            self._miner.rpc.pwd
+                            if self._miner.rpc.pwd is not None
                             else "",
                         ),
                     )
@@ -155,10 +230,11 @@ class MinerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 )
             )
 
+        if not schema_data:
+            return await self.async_step_title()
+
         schema = vol.Schema(schema_data)
         if not user_input:
-            if len(schema_data) == 0:
-                return await self.async_step_title()
             return self.async_show_form(step_id="login", data_schema=schema)
 
         self._data.update(user_input)
@@ -166,20 +242,15 @@ class MinerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     async def async_step_title(self, user_input=None):
         """Get entity title."""
-        title = await self._miner.get_hostname()
-
-        if user_input is None:
-            user_input = {}
-
-        data_schema = vol.Schema(
-            {
-                vol.Required(
-                    CONF_TITLE,
-                    default=user_input.get(CONF_TITLE, title),
-                ): str,
-            }
-        )
         if not user_input:
+            if self._title is None:
+                self._title = await self._miner.get_hostname()
+
+            data_schema = vol.Schema(
+                {
+                    vol.Required(CONF_TITLE, default=self._title): str,
+                }
+            )
             return self.async_show_form(step_id="title", data_schema=data_schema)
 
         self._data.update(user_input)
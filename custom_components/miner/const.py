@@ -10,6 +10,13 @@ CONF_RPC_PASSWORD = "rpc_password"
 CONF_WEB_PASSWORD = "web_password"
 CONF_WEB_USERNAME = "web_username"
 
+# Skip discovery on adapters with subnets larger than a /22 (1022 hosts)
+DISCOVERY_MIN_NETWORK_PREFIX = 22
+# Seconds to reuse a discovery result before scanning the network again
+DISCOVERY_CACHE_TTL = 300
+# Maximum number of hosts probed at the same time during discovery
+DISCOVERY_SCAN_CONCURRENCY = 256
+
 SERVICE_REBOOT = "reboot"
 SERVICE_RESTART_BACKEND = "restart_backend"
 
@@ -27,7 +27,6 @@ async def async_setup_entry(
     """Add sensors for passed config_entry in HA."""
     coordinator: MinerCoordinator = hass.data[DOMAIN][config_entry.entry_id]
 
-    await coordinator.async_config_entry_first_refresh()
     if coordinator.miner.supports_autotuning:
         async_add_entities(
             [
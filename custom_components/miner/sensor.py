@@ -2,8 +2,9 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Callable
 from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Final
 
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.components.sensor import SensorEntityDescription
@@ -12,10 +13,10 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import REVOLUTIONS_PER_MINUTE
 from homeassistant.const import UnitOfPower
 from homeassistant.const import UnitOfTemperature
+from homeassistant.core import callback
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import entity
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.typing import StateType
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
@@ -30,61 +31,66 @@ _LOGGER = logging.getLogger(__name__)
 class MinerSensorEntityDescription(SensorEntityDescription):
     """Class describing ASIC Miner sensor entities."""
 
-    value: Callable = None
-
-
-ENTITY_DESCRIPTION_KEY_MAP: dict[str, MinerSensorEntityDescription] = {
-    "temperature": MinerSensorEntityDescription(
-        key="Temperature",
-        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    "board_temperature": MinerSensorEntityDescription(
-        key="Board Temperature",
-        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    "chip_temperature": MinerSensorEntityDescription(
-        key="Chip Temperature",
-        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    "hashrate": MinerSensorEntityDescription(
-        key="Hashrate",
-        native_unit_of_measurement=TERA_HASH_PER_SECOND,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    "ideal_hashrate": MinerSensorEntityDescription(
-        key="Ideal Hashrate",
-        native_unit_of_measurement=TERA_HASH_PER_SECOND,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    "board_hashrate": MinerSensorEntityDescription(
-        key="Board Hashrate",
-        native_unit_of_measurement=TERA_HASH_PER_SECOND,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    "power_limit": MinerSensorEntityDescription(
-        key="Power Limit",
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement=UnitOfPower.WATT,
-    ),
-    "miner_consumption": MinerSensorEntityDescription(
-        key="Miner Consumption",
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement=UnitOfPower.WATT,
-    ),
-    "efficiency": MinerSensorEntityDescription(
-        key="Efficiency",
-        native_unit_of_measurement=JOULES_PER_TERA_HASH,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    "fan_speed": MinerSensorEntityDescription(
-        key="Fan Speed",
-        native_unit_of_measurement=REVOLUTIONS_PER_MINUTE,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-}
+
+ENTITY_DESCRIPTION_KEY_MAP: Final = MappingProxyType(
+    {
+        "temperature": MinerSensorEntityDescription(
+            key="Temperature",
+            native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+            state_class=SensorStateClass.MEASUREMENT,
+        ),
+        "board_temperature": MinerSensorEntityDescription(
+            key="Board Temperature",
+            native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+            state_class=SensorStateClass.MEASUREMENT,
+        ),
+        "chip_temperature": MinerSensorEntityDescription(
+            key="Chip Temperature",
+            native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+            state_class=SensorStateClass.MEASUREMENT,
+        ),
+        "hashrate": MinerSensorEntityDescription(
+            key="Hashrate",
+            native_unit_of_measurement=TERA_HASH_PER_SECOND,
+            state_class=SensorStateClass.MEASUREMENT,
+        ),
+        "ideal_hashrate": MinerSensorEntityDescription(
+            key="Ideal Hashrate",
+            native_unit_of_measurement=TERA_HASH_PER_SECOND,
+            state_class=SensorStateClass.MEASUREMENT,
+        ),
+        "board_hashrate": MinerSensorEntityDescription(
+            key="Board Hashrate",
+            native_unit_of_measurement=TERA_HASH_PER_SECOND,
+            state_class=SensorStateClass.MEASUREMENT,
+        ),
+        "power_limit": MinerSensorEntityDescription(
+            key="Power Limit",
+            state_class=SensorStateClass.MEASUREMENT,
+            native_unit_of_measurement=UnitOfPower.WATT,
+        ),
+        "miner_consumption": MinerSensorEntityDescription(
+            key="Miner Consumption",
+            state_class=SensorStateClass.MEASUREMENT,
+            native_unit_of_measurement=UnitOfPower.WATT,
+        ),
+        "efficiency": MinerSensorEntityDescription(
+            key="Efficiency",
+            native_unit_of_measurement=JOULES_PER_TERA_HASH,
+            state_class=SensorStateClass.MEASUREMENT,
+        ),
+        "fan_speed": MinerSensorEntityDescription(
+            key="Fan Speed",
+            native_unit_of_measurement=REVOLUTIONS_PER_MINUTE,
+            state_class=SensorStateClass.MEASUREMENT,
+        ),
+    }
+)
+
+DEFAULT_DESCRIPTION = MinerSensorEntityDescription("base_sensor")
+
+BOARD_SENSORS = ("board_temperature", "chip_temperature", "board_hashrate")
+FAN_SENSORS = ("fan_speed",)
 
 
 async def async_setup_entry(
@@ -97,9 +103,7 @@ async def async_setup_entry(
 
     def _create_miner_entity(sensor: str) -> MinerSensor:
         """Create a miner sensor entity."""
-        description = ENTITY_DESCRIPTION_KEY_MAP.get(
-            sensor, MinerSensorEntityDescription("base_sensor")
-        )
+        description = ENTITY_DESCRIPTION_KEY_MAP.get(sensor, DEFAULT_DESCRIPTION)
         return MinerSensor(
             coordinator=coordinator,
             sensor=sensor,
@@ -108,9 +112,7 @@ async def async_setup_entry(
 
     def _create_board_entity(board_num: int, sensor: str) -> MinerBoardSensor:
         """Create a board sensor entity."""
-        description = ENTITY_DESCRIPTION_KEY_MAP.get(
-            sensor, MinerSensorEntityDescription("base_sensor")
-        )
+        description = ENTITY_DESCRIPTION_KEY_MAP.get(sensor, DEFAULT_DESCRIPTION)
         return MinerBoardSensor(
             coordinator=coordinator,
             board_num=board_num,
@@ -120,9 +122,7 @@ async def async_setup_entry(
 
     def _create_fan_entity(fan_num: int, sensor: str) -> MinerFanSensor:
         """Create a fan sensor entity."""
-        description = ENTITY_DESCRIPTION_KEY_MAP.get(
-            sensor, MinerSensorEntityDescription("base_sensor")
-        )
+        description = ENTITY_DESCRIPTION_KEY_MAP.get(sensor, DEFAULT_DESCRIPTION)
         return MinerFanSensor(
             coordinator=coordinator,
             fan_num=fan_num,
@@ -130,17 +130,17 @@ async def async_setup_entry(
             entity_description=description,
         )
 
-    await coordinator.async_config_entry_first_refresh()
-
-    sensors = []
-    for s in coordinator.data["miner_sensors"]:
-        sensors.append(_create_miner_entity(s))
-    for board in range(coordinator.miner.expected_hashboards):
-        for s in ["board_temperature", "chip_temperature", "board_hashrate"]:
-            sensors.append(_create_board_entity(board, s))
-    for fan in range(coordinator.miner.expected_fans):
-        for s in ["fan_speed"]:
-            sensors.append(_create_fan_entity(fan, s))
+    sensors = [_create_miner_entity(s) for s in coordinator.data["miner_sensors"]]
+    sensors.extend(
+        _create_board_entity(board, s)
+        for board in range(coordinator.miner.expected_hashboards)
+        for s in BOARD_SENSORS
+    )
+    sensors.extend(
+        _create_fan_entity(fan, s)
+        for fan in range(coordinator.miner.expected_fans)
+        for s in FAN_SENSORS
+    )
     async_add_entities(sensors)
 
 
@@ -160,35 +160,26 @@ class MinerSensor(CoordinatorEntity[MinerCoordinator], SensorEntity):
         self._attr_unique_id = f"{self.coordinator.data['mac']}-{sensor}"
         self._sensor = sensor
         self.entity_description = entity_description
-
-    @property
-    def _sensor_data(self):
-        """Return sensor data."""
-        try:
-            return self.coordinator.data["miner_sensors"][self._sensor]
-        except LookupError:
-            return None
-
-    @property
-    def name(self) -> str | None:
-        """Return name of the entity."""
-        return f"{self.coordinator.entry.title} {self.entity_description.key}"
-
-    @property
-    def device_info(self) -> entity.DeviceInfo:
-        """Return device info."""
-        return entity.DeviceInfo(
+        self._attr_name = f"{self.coordinator.entry.title} {entity_description.key}"
+        self._attr_device_info = entity.DeviceInfo(
             identifiers={(DOMAIN, self.coordinator.data["mac"])},
             manufacturer=self.coordinator.data["make"],
             model=self.coordinator.data["model"],
             sw_version=self.coordinator.data["fw_ver"],
             name=f"{self.coordinator.entry.title}",
         )
+        self._attr_native_value = self._sensor_data
 
     @property
-    def native_value(self) -> StateType:
-        """Return the state of the sensor."""
-        return self._sensor_data
+    def _sensor_data(self):
+        """Return sensor data."""
+        return self.coordinator.data["miner_sensors"].get(self._sensor)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        self._attr_native_value = self._sensor_data
+
+        super()._handle_coordinator_update()
 
     @property
     def available(self) -> bool:
@@ -214,35 +205,30 @@ class MinerBoardSensor(CoordinatorEntity[MinerCoordinator], SensorEntity):
         self._board_num = board_num
         self._sensor = sensor
         self.entity_description = entity_description
-
-    @property
-    def _sensor_data(self):
-        """Return sensor data."""
-        try:
-            return self.coordinator.data["board_sensors"][self._board_num][self._sensor]
-        except LookupError:
-            return None
-
-    @property
-    def name(self) -> str | None:
-        """Return name of the entity."""
-        return f"{self.coordinator.entry.title} Board #{self._board_num} {self.entity_description.key}"
-
-    @property
-    def device_info(self) -> entity.DeviceInfo:
-        """Return device info."""
-        return entity.DeviceInfo(
+        self._attr_name = f"{self.coordinator.entry.title} Board #{self._board_num} {self.entity_description.key}"
+        self._attr_device_info = entity.DeviceInfo(
             identifiers={(DOMAIN, self.coordinator.data["mac"])},
             manufacturer=self.coordinator.data["make"],
             model=self.coordinator.data["model"],
             sw_version=self.coordinator.data["fw_ver"],
             name=f"{self.coordinator.entry.title}",
         )
+        self._attr_native_value = self._sensor_data
 
     @property
-    def native_value(self) -> StateType:
-        """Return the state of the sensor."""
-        return self._sensor_data
+    def _sensor_data(self):
+        """Return sensor data."""
+        return (
+            self.coordinator.data["board_sensors"]
+            .get(self._board_num, {})
+            .get(self._sensor)
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        self._attr_native_value = self._sensor_data
+
+        super()._handle_coordinator_update()
 
     @property
     def available(self) -> bool:
@@ -268,36 +254,31 @@ class MinerFanSensor(CoordinatorEntity[MinerCoordinator], SensorEntity):
         self._fan_num = fan_num
         self._sensor = sensor
         self.entity_description = entity_description
-        self._attr_force_update = True
-
-    @property
-    def _sensor_data(self):
-        """Return sensor data."""
-        try:
-            return self.coordinator.data["fan_sensors"][self._fan_num][self._sensor]
-        except LookupError:
-            return None
-
-    @property
-    def name(self) -> str | None:
-        """Return name of the entity."""
-        return f"{self.coordinator.entry.title} Fan #{self._fan_num} {self.entity_description.key}"
-
-    @property
-    def device_info(self) -> entity.DeviceInfo:
-        """Return device info."""
-        return entity.DeviceInfo(
+        self._attr_name = f"{self.coordinator.entry.title} Fan #{self._fan_num} {self.entity_description.key}"
+        self._attr_device_info = entity.DeviceInfo(
             identifiers={(DOMAIN, self.coordinator.data["mac"])},
             manufacturer=self.coordinator.data["make"],
             model=self.coordinator.data["model"],
             sw_version=self.coordinator.data["fw_ver"],
             name=f"{self.coordinator.entry.title}",
         )
+        self._attr_native_value = self._sensor_data
+        self._attr_force_update = True
 
     @property
-    def native_value(self) -> StateType:
-        """Return the state of the sensor."""
-        return self._sensor_data
+    def _sensor_data(self):
+        """Return sensor data."""
+        return (
+            self.coordinator.data["fan_sensors"]
+            .get(self._fan_num, {})
+            .get(self._sensor)
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        self._attr_native_value = self._sensor_data
+
+        super()._handle_coordinator_update()
 
     @property
     def available(self) -> bool:
@@ -2,10 +2,7 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Callable
-from dataclasses import dataclass
 
-from homeassistant.components.sensor import SensorEntityDescription
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import callback
@@ -20,13 +17,6 @@ from .coordinator import MinerCoordinator
 _LOGGER = logging.getLogger(__name__)
 
 
-@dataclass
-class MinerSensorEntityDescription(SensorEntityDescription):
-    """Class describing Miner sensor entities."""
-
-    value: Callable = None
-
-
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -41,7 +31,6 @@ async def async_setup_entry(
         """Create a sensor entity."""
         created.add(key)
 
-    await coordinator.async_config_entry_first_refresh()
     if coordinator.miner.supports_shutdown:
         async_add_entities(
             [